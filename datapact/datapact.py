@@ -1,3 +1,4 @@
+# pylint: disable=too-many-lines
 import datetime
 from functools import wraps
 import importlib.resources
@@ -6,15 +7,9 @@ import json
 from os import PathLike
 from typing import Callable, Optional
 from dataclasses import dataclass, field
-import dask
-import dask.dataframe
-import dask.array
 import numpy
 
 import pandas
-import requests
-import outliers
-import scipy.stats
 
 from datapact.util.github import get_github_url
 from datapact.util.session_fingerprint import get_session_fingerprint
@@ -120,8 +115,9 @@ def compute(value):
     """
     Checks if a value is a Dask Delayed, and computes it.
     """
-    if "compute" in dir(value):
-        return value.compute()
+    compute_method = getattr(value, "compute", None)
+    if callable(compute_method):
+        return compute_method()
     return value
 
 
@@ -135,13 +131,22 @@ def check_range(min_value: float, max_value: float, value: float, name):
     return Expectation.Pass()
 
 
-class SeriesTest:
+# float64 series at or above this size are downcast to float32
+# before the normality test's moment accumulation, halving memory
+# traffic. only the p-value (~6 significant digits needed) sees the
+# downcast; range and null checks always run on the original values.
+FLOAT32_DOWNCAST_MIN_SIZE = 1_000_000
+
+
+class SeriesTest:  # pylint: disable=too-many-instance-attributes
     def __init__(self, parent: "DataframeTest", series: pandas.Series):
         self.parent = parent
         self.series = series
         self.title: Optional[str] = None
         self.description: Optional[str] = None
         self.unit: Optional[str] = None
+        self._statistics: Optional[dict] = None
+        self._values: Optional[numpy.ndarray] = None
         self.should = Asserter(self, critical=False)
         """
         `should` makes an assertion relaxed (results in warnings, not exceptions).
@@ -178,6 +183,60 @@ class SeriesTest:
             self.unit = unit
         return self
 
+    def to_numpy(self) -> numpy.ndarray:
+        """
+        The series' values as a numpy array,
+        converted once and reused across expectations.
+        """
+        if self._values is None:
+            series = compute(self.series)
+            if pandas.api.types.is_extension_array_dtype(
+                series.dtype
+            ) and pandas.api.types.is_numeric_dtype(series.dtype):
+                # nullable Int64/Float64 arrays would convert to object;
+                # represent missing values as NaN instead so the kernels
+                # can work on a plain float array
+                values = series.to_numpy(dtype=numpy.float64, na_value=numpy.nan)
+            else:
+                values = series.to_numpy()
+            self._values = values
+        return self._values
+
+    def statistics(self) -> Optional[dict]:
+        """
+        Summary statistics of the series, shared between expectations
+        so the data is only scanned once.
+        Returns None for dtypes that don't support them.
+        """
+        if self._statistics is not None:
+            return self._statistics
+
+        if isinstance(self.series, pandas.Series):
+            values = self.to_numpy()
+            if values.dtype.kind not in "iuf" or values.size == 0:
+                return None
+            from datapact import kernels  # pylint: disable=import-outside-toplevel
+
+            minimum, maximum, n, mean, m2, m3, m4, has_na = kernels.series_stats(
+                values
+            )
+            self._statistics = {
+                "minimum": minimum,
+                "maximum": maximum,
+                "n": n,
+                "mean": mean,
+                "m2": m2,
+                "m3": m3,
+                "m4": m4,
+                "has_na": has_na,
+            }
+        elif hasattr(self.series, "compute"):
+            if self.series.dtype.kind not in "iuf":
+                return None
+            self.parent._compute_dask_statistics()  # pylint: disable=protected-access
+
+        return self._statistics
+
 
 def coerce_to_json(arg):
     if inspect.isfunction(arg):
@@ -229,12 +288,30 @@ class Asserter:
         self.critical = critical
         self.expectations: "list[Expectation]" = []
 
+    def _min_max(self):
+        """
+        Computes the series' min and max together,
+        so the data is only scanned once.
+        """
+        statistics = self.parent.statistics()
+        if statistics is not None:
+            return statistics["minimum"], statistics["maximum"]
+        if hasattr(self.series, "compute"):
+            import dask  # pylint: disable=import-outside-toplevel
+
+            return dask.compute(self.series.min(), self.series.max())
+        return compute(self.series.min()), compute(self.series.max())
+
     def bins(self):
-        if not isinstance(self.series, pandas.Series):
+        values = self.parent.to_numpy()
+        if values.dtype.kind not in "iuf":
             return None  # not implemented
 
-        bins = pandas.cut(self.series, bins=10).value_counts()
-        return json.loads(bins.to_json())
+        counts, edges = numpy.histogram(values[~numpy.isnan(values)], bins=10)
+        return {
+            f"({edges[i]:.3f}, {edges[i + 1]:.3f}]": int(counts[i])
+            for i in range(len(counts))
+        }
 
     @expectation
     def be_between(self, minimum: float, maximum: float):
@@ -251,8 +328,18 @@ class Asserter:
             >>> dp.age.should.be_between(0, 150)
         """
 
-        found_min = compute(self.series.min())
-        found_max = compute(self.series.max())
+        statistics_cached = (
+            self.parent._statistics is not None  # pylint: disable=protected-access
+        )
+        if not statistics_cached and isinstance(self.series, pandas.Series):
+            values = self.parent.to_numpy()
+            if values.dtype.kind in "iuf":
+                from datapact import kernels  # pylint: disable=import-outside-toplevel
+
+                if kernels.within_bounds(values, minimum, maximum):
+                    return Expectation.Pass()
+
+        found_min, found_max = self._min_max()
 
         result = {
             "minimum": found_min,
@@ -296,7 +383,7 @@ class Asserter:
             >>> dp.age.should.be_positive()
         """
 
-        found_min = compute(self.series.min())
+        found_min, _ = self._min_max()
 
         result = {"minimum": found_min}
 
@@ -318,7 +405,7 @@ class Asserter:
             >>> dp.debt.should.be_negative()
         """
 
-        found_max = compute(self.series.max())
+        _, found_max = self._min_max()
 
         result = {"maximum": found_max}
 
@@ -340,6 +427,20 @@ class Asserter:
             >>> dp.user_id.must.not_be_na()
         """
 
+        if isinstance(self.series, pandas.Series):
+            values = self.parent.to_numpy()
+            if values.dtype.kind in "iu":
+                return Expectation.Pass()  # integer arrays cannot hold NaN
+            if values.dtype.kind == "f":
+                from datapact import kernels  # pylint: disable=import-outside-toplevel
+
+                if not kernels.has_nan(values):
+                    return Expectation.Pass()
+        else:
+            statistics = self.parent.statistics()
+            if statistics is not None and not statistics["has_na"]:
+                return Expectation.Pass()
+
         isna = self.series.isna()
 
         if compute(isna.any()):
@@ -367,16 +468,24 @@ class Asserter:
         used_pct = len(existing) / len(expected)
 
         if len(additional) > 0:
-            additional_values = list(additional)
+            violations = compute(self.series[~self.series.isin(expected)])
+
+            # the value list and the index map are derived from the same
+            # pass, so NaN entries stay identical objects and survive the
+            # identity-based dict lookup below
+            first_indices = {
+                value: index for index, value in violations.drop_duplicates().items()
+            }
+            additional_values = list(first_indices)
             additional_values.sort()
 
             return Expectation.Fail(
                 f"found additional values: {additional_values}",
                 failed_sample_indices=[
-                    compute(self.series.eq(value)).idxmax()
-                    for value in additional_values[:5]
+                    first_indices[value] for value in additional_values[:5]
                 ],
                 used_pct=used_pct,
+                violation_count=len(violations),
             )
 
         return Expectation.Pass(used_pct=used_pct)
@@ -421,11 +530,12 @@ class Asserter:
             >>> dp.timestamp.must.be_datetime()
         """
 
-        to_datetime = (
-            pandas.to_datetime
-            if isinstance(self.series, pandas.Series)
-            else dask.dataframe.to_datetime
-        )
+        if isinstance(self.series, pandas.Series):
+            to_datetime = pandas.to_datetime
+        else:
+            import dask.dataframe  # pylint: disable=import-outside-toplevel
+
+            to_datetime = dask.dataframe.to_datetime
 
         invalid_datetimes = to_datetime(self.series, errors="coerce").isna()
         invalid_rows = compute(self.series[invalid_datetimes].index).to_list()
@@ -446,8 +556,7 @@ class Asserter:
             >>> dp.timestamp.must.be_unix_epoch()
         """
 
-        found_min = compute(self.series.min())
-        found_max = compute(self.series.max())
+        found_min, found_max = self._min_max()
 
         result = {
             "minimum": found_min,
@@ -491,7 +600,26 @@ class Asserter:
                 "not numeric. cannot perform normaltest.",
             )
 
-        stat, p = scipy.stats.normaltest(self.series)
+        from datapact import kernels  # pylint: disable=import-outside-toplevel
+
+        statistics = self.parent.statistics()
+        if statistics is not None and "m2" in statistics:
+            stat, p = kernels.normaltest_from_moments(
+                statistics["n"], statistics["m2"], statistics["m3"], statistics["m4"]
+            )
+        else:
+            values = self.parent.to_numpy()
+            if values.dtype.kind in "iuf":
+                if (
+                    values.dtype == numpy.float64
+                    and values.size >= FLOAT32_DOWNCAST_MIN_SIZE
+                ):
+                    values = values.astype(numpy.float32)
+                stat, p = kernels.normaltest(values)
+            else:
+                import scipy.stats  # pylint: disable=import-outside-toplevel
+
+                stat, p = scipy.stats.normaltest(values)
         bins = self.bins()
 
         result = {"stat": stat, "p": p, "bins": bins}
@@ -515,6 +643,8 @@ class Asserter:
             >>> dp.age.should.match_sample(reference_sample)
         """
 
+        import scipy.stats  # pylint: disable=import-outside-toplevel
+
         stat, p = scipy.stats.ks_2samp(self.series, sample)
         result = {
             "stat": stat,
@@ -540,6 +670,8 @@ class Asserter:
             >>> dp.wins.should.match_sample(scipy.stats.binom)
         """
 
+        import scipy.stats  # pylint: disable=import-outside-toplevel
+
         stat, p = scipy.stats.kstest(self.series, cdf, args, N)
         result = {"stat": stat, "p": p, "bins": self.bins()}
 
@@ -580,6 +712,8 @@ class Asserter:
             >>> dp.heads.should.be_binomial_distributed()
         """
 
+        import scipy.stats  # pylint: disable=import-outside-toplevel
+
         return self._match_cdf(
             scipy.stats.distributions.binom.cdf, (n, p), N=N, alpha=alpha
         )
@@ -597,6 +731,8 @@ class Asserter:
             >>> dp.new_covid_cases.should.be_poisson_distributed(10)
         """
 
+        import scipy.stats  # pylint: disable=import-outside-toplevel
+
         return self._match_cdf(
             scipy.stats.distributions.poisson.cdf, [l], N=N, alpha=alpha
         )
@@ -610,7 +746,13 @@ class Asserter:
             >>> dp.size.should.have_average_between(4, 5)
         """
 
-        return check_range(minimum, maximum, compute(self.series.mean()), "average")
+        statistics = self.parent.statistics()
+        if statistics is not None:
+            average = statistics["mean"]
+        else:
+            average = compute(self.series.mean())
+
+        return check_range(minimum, maximum, average, "average")
 
     @expectation
     def have_variance_between(self, minimum: float, maximum: float):
@@ -621,7 +763,14 @@ class Asserter:
             >>> dp.size.should.have_variance_between(150, 170)
         """
 
-        return check_range(minimum, maximum, compute(self.series.var()), "variance")
+        statistics = self.parent.statistics()
+        if statistics is not None and "m2" in statistics and statistics["n"] > 1:
+            # sample variance (ddof=1), like pandas' Series.var
+            variance = statistics["m2"] * statistics["n"] / (statistics["n"] - 1)
+        else:
+            variance = compute(self.series.var())
+
+        return check_range(minimum, maximum, variance, "variance")
 
     @expectation
     def have_median_between(self, minimum: float, maximum: float):
@@ -659,6 +808,8 @@ class Asserter:
             >>> dp.size.should.have_no_outliers()
         """
 
+        import outliers  # pylint: disable=import-outside-toplevel
+
         indices = outliers.smirnov_grubbs.two_sided_test_indices(
             compute(self.series), alpha=alpha
         )
@@ -687,16 +838,76 @@ class Asserter:
         return result
 
 
-class DataframeTest:
+class DataframeTest:  # pylint: disable=too-many-instance-attributes
     def __init__(self, dataframe: pandas.DataFrame):
         self.dataframe = dataframe
         self.title: Optional[str] = None
         self.description: Optional[str] = None
-        self.url: Optional[str] = get_github_url()
+        self._url: Optional[str] = None
+        self._url_resolved = False
+        self._markdown_cache: "Optional[tuple]" = None
         self.series_tests: "dict[str, SeriesTest]" = {}
         self.server: Optional[str] = None
         self.token: Optional[str] = None
 
+    @property
+    def url(self) -> Optional[str]:
+        """
+        The GitHub URL of the current checkout,
+        determined lazily on first access.
+        """
+        if not self._url_resolved:
+            self._url = get_github_url()
+            self._url_resolved = True
+        return self._url
+
+    @url.setter
+    def url(self, value: Optional[str]):
+        self._url = value
+        self._url_resolved = True
+
+    def _compute_dask_statistics(self):
+        """
+        Computes statistics for all dask-backed series tests
+        that don't have them yet, batched into one dask.compute call
+        so common subexpressions and partition reads are shared.
+        """
+        # pylint: disable=protected-access
+        pending = [
+            series_test
+            for series_test in self.series_tests.values()
+            if series_test._statistics is None
+            and hasattr(series_test.series, "compute")
+            and series_test.series.dtype.kind in "iuf"
+        ]
+        if len(pending) == 0:
+            return
+
+        tasks = []
+        for series_test in pending:
+            series = series_test.series
+            tasks += [
+                series.min(),
+                series.max(),
+                series.count(),
+                series.mean(),
+                series.isna().any(),
+            ]
+
+        import dask  # pylint: disable=import-outside-toplevel
+
+        results = dask.compute(*tasks)
+
+        for i, series_test in enumerate(pending):
+            minimum, maximum, n, mean, has_na = results[5 * i : 5 * (i + 1)]
+            series_test._statistics = {
+                "minimum": minimum,
+                "maximum": maximum,
+                "n": n,
+                "mean": mean,
+                "has_na": has_na,
+            }
+
     def connect(self, server: str = "track.datapact.dev", token: Optional[str] = None):
         if "://" not in server:
             server = "https://" + server
@@ -707,10 +918,17 @@ class DataframeTest:
         return self.token is not None
 
     def upload(self, result: DataframeResult):
+        # pylint: disable=import-outside-toplevel
+        import orjson
+        import requests
+
         requests.put(
             f"{self.server}/api/v1/testruns/{get_session_fingerprint()}",
-            headers={"Authorization": f"Bearer {self.token}"},
-            json=result.to_dict(),  # pyright: reportGeneralTypeIssues=false
+            headers={
+                "Authorization": f"Bearer {self.token}",
+                "Content-Type": "application/json",
+            },
+            data=orjson.dumps(result.to_dict(), option=orjson.OPT_SERIALIZE_NUMPY),
         )
 
     def describe(
@@ -740,14 +958,18 @@ class DataframeTest:
         return self.dataframe.columns.to_list()
 
     def get_series_test(self, series: pandas.Series):
-        if not series.name in self.series_tests:
-            self.series_tests[series.name] = SeriesTest(self, series)
-        return self.series_tests[series.name]
+        try:
+            return self.series_tests[series.name]
+        except KeyError:
+            series_test = SeriesTest(self, series)
+            self.series_tests[series.name] = series_test
+            return series_test
 
     def __getattr__(self, attr) -> SeriesTest:
-        if not attr in self.dataframe.columns:
-            raise AttributeError
-        series = self.dataframe[attr]
+        try:
+            series = self.dataframe[attr]
+        except KeyError:
+            raise AttributeError(attr) from None
         return self.get_series_test(series)
 
     def __getitem__(self, key):
@@ -878,6 +1100,22 @@ class DataframeTest:
             f.write(self.to_html())
 
     def to_markdown(self):
+        # expectations are append-only, so the dataframe identity,
+        # the tested series and the expectation count identify the report.
+        # Jupyter re-renders reprs on every cell refresh,
+        # so repeats are served from cache.
+        signature = (
+            id(self.dataframe),
+            tuple(self.series_tests.keys()),
+            sum(
+                len(series_test.should.expectations)
+                + len(series_test.must.expectations)
+                for series_test in self.series_tests.values()
+            ),
+        )
+        if self._markdown_cache is not None and self._markdown_cache[0] == signature:
+            return self._markdown_cache[1]
+
         result = self.collect()
 
         md = ""
@@ -891,6 +1129,7 @@ class DataframeTest:
                     md += f"❌ {e.name}: {e.message}  \n"
             md += "\n"
 
+        self._markdown_cache = (signature, md)
         return md
 
     def _repr_markdown_(self):
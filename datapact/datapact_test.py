@@ -95,6 +95,14 @@ def test_describe(iris_df: pandas.DataFrame):
     assert "https://datapact.dev" in dp.to_html()
 
 
+def test_markdown_reflects_new_series(iris_df: pandas.DataFrame):
+    dp = datapact.test(iris_df)
+    dp.SepalLength.should.be_positive()
+    assert "PetalLength" not in dp.to_markdown()
+    dp.PetalLength.should.be_positive()
+    assert "PetalLength" in dp.to_markdown()
+
+
 def test_write_html(iris_df: pandas.DataFrame, tmp_path: Path):
     dp = datapact.test(iris_df)
     dp.describe(title="foo")
@@ -119,6 +127,12 @@ def test_be_normal_distributed(iris_df: pandas.DataFrame, covid_df: pandas.DataF
     covid_dp = datapact.test(covid_df)
     assert covid_dp.new_case.should.be_normal_distributed().success is False
 
+    # degenerate inputs yield p=nan instead of raising
+    constant_dp = datapact.test(pandas.DataFrame({"x": [1.0] * 100}))
+    assert constant_dp.x.should.be_normal_distributed().success
+    short_dp = datapact.test(pandas.DataFrame({"x": [1.0, 2.0, 3.0]}))
+    assert short_dp.x.should.be_normal_distributed().success
+
 
 def test_be_between(iris_df: pandas.DataFrame):
     dp = datapact.test(iris_df)
@@ -151,6 +165,20 @@ def test_not_be_na(contrived_df: pandas.DataFrame):
     assert not dp.optional.should.not_be_na()
 
 
+def test_nullable_dtypes():
+    df = pandas.DataFrame(
+        {
+            "present": pandas.array([1, 2, 3], dtype="Int64"),
+            "missing": pandas.array([1.5, None, 3.5], dtype="Float64"),
+        }
+    )
+    dp = datapact.test(df)
+    assert dp.present.must.be_between(1, 3)
+    assert dp.present.must.not_be_na()
+    assert not dp.missing.must.not_be_na()
+    assert dp.missing.should.be_positive().result == {"minimum": 1.5}
+
+
 def test_be_datetime(contrived_df: pandas.DataFrame):
     dp = datapact.test(contrived_df)
     assert dp.datetime.should.be_datetime()
@@ -204,6 +232,16 @@ def test_be_one_of(iris_df: pandas.DataFrame):
     }
 
 
+def test_be_one_of_with_nan():
+    df = pandas.DataFrame({"x": [1.0, 2.0, float("nan"), 5.0]})
+    dp = datapact.test(df)
+    result = dp.x.must.be_one_of(1.0, 2.0)
+    assert not result.success
+    assert result.result["violation_count"] == 2
+    assert result.failed_sample_indices is not None
+    assert set(result.failed_sample_indices) == {2, 3}
+
+
 def test_spaces_in_series_name(covid_df: pandas.DataFrame):
     dp = datapact.test(covid_df)
     assert (
@@ -8,9 +8,9 @@ import dask.dataframe
 from datapact import compute
 
 
-iris_pandas = pandas.read_csv("datapact/iris.csv")
-iris_dask = dask.dataframe.read_csv(  # pyright: ignore [reportPrivateImportUsage]
-    "datapact/iris.csv"
+iris_pandas = pandas.read_csv("datapact/iris.csv", engine="pyarrow")
+iris_dask = dask.dataframe.from_pandas(  # pyright: ignore [reportPrivateImportUsage]
+    iris_pandas, npartitions=2
 )
 
 
@@ -23,7 +23,13 @@ def test_fixture_iris_df(iris_df: pandas.DataFrame):
     assert compute(iris_df.size) == 750
 
 
-covid_pandas = pandas.read_csv("datapact/covid.csv")
+# the date columns are pinned to str so pyarrow's parser
+# doesn't eagerly convert them to date objects
+covid_pandas = pandas.read_csv(
+    "datapact/covid.csv",
+    engine="pyarrow",
+    dtype={"report_date": str, "ref_date": str},
+)
 covid_pandas_typed = pandas.read_csv(
     "datapact/covid.csv",
     dtype={
@@ -40,8 +46,8 @@ covid_pandas_typed = pandas.read_csv(
     },
     parse_dates=["report_date", "ref_date"],
 )
-covid_dask = dask.dataframe.read_csv(  # pyright: ignore [reportPrivateImportUsage]
-    "datapact/covid.csv"
+covid_dask = dask.dataframe.from_pandas(  # pyright: ignore [reportPrivateImportUsage]
+    covid_pandas, npartitions=2
 )
 
 
@@ -63,8 +69,8 @@ def test_fixture_pandas_typed():
 
 
 contrived_pandas = pandas.read_csv("datapact/contrived.csv")
-contrived_dask = dask.dataframe.read_csv(  # pyright: ignore [reportPrivateImportUsage]
-    "datapact/contrived.csv"
+contrived_dask = dask.dataframe.from_pandas(  # pyright: ignore [reportPrivateImportUsage]
+    contrived_pandas, npartitions=2
 )
 
 
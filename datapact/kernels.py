@@ -0,0 +1,155 @@
+"""
+numba-compiled kernels backing the expectations.
+They live in their own module so `import datapact` doesn't pay
+numba's import cost until a kernel is actually needed.
+"""
+
+import math
+
+import numba
+import numpy
+
+
+@numba.njit(cache=True)
+def series_stats(values: numpy.ndarray):
+    """
+    Computes min, max, count, mean, the second to fourth central moments
+    and NaN presence in one fused scan over the array.
+
+    The accumulators are float64 even for float32 input,
+    so downcast arrays only save bandwidth, not accuracy.
+    """
+    minimum = values[0]
+    maximum = values[0]
+    seen_value = False
+    has_na = False
+    n = 0
+    total = 0.0
+    for i in range(values.size):
+        value = values[i]
+        # NaN never equals itself
+        if value != value:  # pylint: disable=comparison-with-itself
+            has_na = True
+            continue
+        if not seen_value:
+            minimum = value
+            maximum = value
+            seen_value = True
+        else:
+            minimum = min(minimum, value)
+            maximum = max(maximum, value)
+        n += 1
+        total += value
+    mean = total / n if n > 0 else numpy.nan
+
+    m2 = 0.0
+    m3 = 0.0
+    m4 = 0.0
+    for i in range(values.size):
+        value = values[i]
+        if value != value:  # pylint: disable=comparison-with-itself
+            continue
+        deviation = value - mean
+        squared = deviation * deviation
+        m2 += squared
+        m3 += squared * deviation
+        m4 += squared * squared
+    if n > 0:
+        m2 /= n
+        m3 /= n
+        m4 /= n
+
+    return minimum, maximum, n, mean, m2, m3, m4, has_na
+
+
+@numba.njit(cache=True)
+def has_nan(values: numpy.ndarray) -> bool:
+    """
+    Returns True on the first NaN encountered,
+    without scanning the rest of the array.
+    """
+    for i in range(values.size):
+        if values[i] != values[i]:
+            return True
+    return False
+
+
+@numba.njit(cache=True)
+def within_bounds(values: numpy.ndarray, minimum: float, maximum: float) -> bool:
+    """
+    Returns False on the first out-of-bounds value,
+    without scanning the rest of the array. NaNs are ignored.
+    """
+    for i in range(values.size):
+        value = values[i]
+        if value < minimum or value > maximum:
+            return False
+    return True
+
+
+@numba.njit(cache=True)
+def normaltest_from_moments(n: int, m2: float, m3: float, m4: float):
+    # pylint: disable=too-many-locals
+    """
+    D'Agostino-Pearson normality test, equivalent to `scipy.stats.normaltest`,
+    derived from precomputed central moments.
+    """
+    # the test is undefined for fewer than 8 observations
+    # or a constant series (m2 == 0); report nan like scipy does
+    # instead of dividing by zero
+    if n < 8 or m2 == 0.0:
+        return numpy.nan, numpy.nan
+
+    # D'Agostino's skewness test
+    b1 = m3 / m2**1.5
+    y = b1 * math.sqrt(((n + 1.0) * (n + 3.0)) / (6.0 * (n - 2.0)))
+    beta2 = (
+        3.0
+        * (n * n + 27.0 * n - 70.0)
+        * (n + 1.0)
+        * (n + 3.0)
+        / ((n - 2.0) * (n + 5.0) * (n + 7.0) * (n + 9.0))
+    )
+    w_squared = -1.0 + math.sqrt(2.0 * (beta2 - 1.0))
+    delta = 1.0 / math.sqrt(0.5 * math.log(w_squared))
+    alpha = math.sqrt(2.0 / (w_squared - 1.0))
+    if y == 0.0:
+        y = 1.0
+    z_skew = delta * math.log(y / alpha + math.sqrt((y / alpha) ** 2 + 1.0))
+
+    # Anscombe-Glynn kurtosis test
+    b2 = m4 / (m2 * m2)
+    expected_b2 = 3.0 * (n - 1.0) / (n + 1.0)
+    var_b2 = (
+        24.0 * n * (n - 2.0) * (n - 3.0) / ((n + 1.0) ** 2 * (n + 3.0) * (n + 5.0))
+    )
+    x = (b2 - expected_b2) / math.sqrt(var_b2)
+    sqrt_beta1 = (
+        6.0
+        * (n * n - 5.0 * n + 2.0)
+        / ((n + 7.0) * (n + 9.0))
+        * math.sqrt((6.0 * (n + 3.0) * (n + 5.0)) / (n * (n - 2.0) * (n - 3.0)))
+    )
+    a = 6.0 + 8.0 / sqrt_beta1 * (
+        2.0 / sqrt_beta1 + math.sqrt(1.0 + 4.0 / (sqrt_beta1 * sqrt_beta1))
+    )
+    term1 = 1.0 - 2.0 / (9.0 * a)
+    denom = 1.0 + x * math.sqrt(2.0 / (a - 4.0))
+    term2 = ((1.0 - 2.0 / a) / abs(denom)) ** (1.0 / 3.0)
+    if denom < 0.0:
+        term2 = -term2
+    z_kurt = (term1 - term2) / math.sqrt(2.0 / (9.0 * a))
+
+    stat = z_skew * z_skew + z_kurt * z_kurt
+    p = math.exp(-stat / 2.0)  # chi2.sf(stat, df=2)
+    return stat, p
+
+
+@numba.njit(cache=True)
+def normaltest(values: numpy.ndarray):
+    """
+    D'Agostino-Pearson normality test over a raw array,
+    skipping NaNs while accumulating the moments.
+    """
+    _, _, n, _, m2, m3, m4, _ = series_stats(values)
+    return normaltest_from_moments(n, m2, m3, m4)
@@ -1,48 +1,74 @@
+import functools
 import re
 import subprocess
 from typing import Optional
 from os import PathLike  # pylint: disable=unused-import
 
+GITHUB_REMOTE_RE = re.compile(r"git@github\.com:([^/]+)/(.+?)\.git$")
+
 
 def get_github_url(cwd: "Optional[PathLike]" = None) -> Optional[str]:
-    originUrlP = subprocess.run(
+    """
+    Determines the GitHub URL of the current checkout.
+    The result for the default working directory is memoized,
+    so repeated calls don't re-spawn git subprocesses.
+    """
+    if cwd is None:
+        return _get_default_github_url()
+    return _fetch_github_url(cwd)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_default_github_url() -> Optional[str]:
+    return _fetch_github_url(None)
+
+
+def _fetch_github_url(cwd: "Optional[PathLike]") -> Optional[str]:
+    # the three git calls are independent, so they are spawned together
+    # and only awaited afterwards, paying the fork+exec latency once.
+    # communicate() reaps each process, so no context manager is needed.
+    # pylint: disable=consider-using-with
+    originUrlP = subprocess.Popen(
         ["git", "remote", "get-url", "origin"],
-        check=False,
-        capture_output=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=cwd,
+    )
+    refP = subprocess.Popen(
+        ["git", "show", "-s", "--format=%H"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
         cwd=cwd,
     )
+    diffP = subprocess.Popen(
+        ["git", "diff", "--exit-code"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=cwd,
+    )
+
+    originUrlStdout, _ = originUrlP.communicate()
+    refStdout, _ = refP.communicate()
+    diffP.communicate()
+
     if originUrlP.returncode != 0:
         return None
 
-    originUrl = originUrlP.stdout.decode("utf-8").strip()
-    match = re.search(r"git@github\.com:(.*)\/(.*)\.git", originUrl)
+    originUrl = originUrlStdout.decode("utf-8").strip()
+    match = GITHUB_REMOTE_RE.search(originUrl)
     if match is None:
         return None
     org = match.group(1)
     repo = match.group(2)
 
-    refP = subprocess.run(
-        ["git", "show", "-s", "--format=%H"],
-        check=False,
-        capture_output=True,
-        cwd=cwd,
-    )
     if refP.returncode != 0:
         return None
 
-    ref = refP.stdout.decode("utf-8").strip()
+    ref = refStdout.decode("utf-8").strip()
 
     url = f"https://github.com/{org}/{repo}/tree/{ref}"
 
-    isClean = (
-        subprocess.run(
-            ["git", "diff", "--exit-code"],
-            check=False,
-            capture_output=True,
-            cwd=cwd,
-        ).returncode
-        == 0
-    )
+    isClean = diffP.returncode == 0
     if not isClean:
         url += "#dirty"
 
@@ -1,12 +1,15 @@
+import functools
 import os
 import platform
 
 import urllib.parse
 
 
+@functools.lru_cache(maxsize=1)
 def get_login():
     return os.path.expanduser("~")
 
 
+@functools.lru_cache(maxsize=1)
 def get_session_fingerprint() -> str:
     return urllib.parse.quote(f"{get_login()}@{platform.node()}", safe="")